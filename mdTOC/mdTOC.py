@@ -1,31 +1,49 @@
 import re
 import os
+import shutil
+import tempfile
+
+# Compiled once at import; both patterns are applied to every line / heading
+HEADER_PATTERN = re.compile(r'^(#{1,6}) (.+)')
+PUNCTUATION_PATTERN = re.compile(r'[^\w\s-]')
 
 def generate_toc(md_file):
     if not os.path.isfile(md_file):
         print(f"File '{md_file}' not found. Please check the file path.")
         return
 
-    with open(md_file, 'r', encoding='utf-8') as file:
-        lines = file.readlines()
-
     toc_lines = []
     content_lines = []
-    for line in lines:
-        header_match = re.match(r'^(#{1,6}) (.+)', line)
-        if header_match:
-            level = len(header_match.group(1))  # Number of # symbols
-            title = header_match.group(2)
-            # Generate anchor link by converting to lowercase, replacing spaces with hyphens, and removing punctuation
-            anchor = re.sub(r'[^\w\s-]', '', title).replace(' ', '-').lower()
-            toc_lines.append(f"{'  ' * (level - 1)}- [{title}](#{anchor})")
-            # Optionally adjust the header to include an explicit ID if needed
-            line = f"{header_match.group(1)} {title} {{#{anchor}}}\n"
-        content_lines.append(line)
+    # Iterate the file object directly rather than loading every line up front
+    with open(md_file, 'r', encoding='utf-8') as file:
+        for line in file:
+            header_match = HEADER_PATTERN.match(line)
+            if header_match:
+                level = len(header_match.group(1))  # Number of # symbols
+                title = header_match.group(2)
+                # Generate anchor link by converting to lowercase, replacing spaces with hyphens, and removing punctuation
+                anchor = PUNCTUATION_PATTERN.sub('', title).replace(' ', '-').lower()
+                toc_lines.append(f"{'  ' * (level - 1)}- [{title}](#{anchor})")
+                # Optionally adjust the header to include an explicit ID if needed
+                line = f"{header_match.group(1)} {title} {{#{anchor}}}\n"
+            content_lines.append(line)
 
-    # Write the TOC and original content back to the same file, without '[TOC]'
-    with open(md_file, 'w', encoding='utf-8') as file:
-        file.write("## Table of Contents\n\n" + "\n".join(toc_lines) + "\n\n" + "".join(content_lines))
+    # Write the TOC and original content back to the same file, without '[TOC]'.
+    # Write to a uniquely named temporary file next to the target first and swap
+    # it in, so an interrupted run cannot leave the original file truncated.
+    # Symlinks are resolved so the link is kept and the file it points to updated.
+    target_file = os.path.realpath(md_file)
+    tmp = tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=os.path.dirname(target_file), delete=False)
+    try:
+        with tmp as file:
+            file.write("## Table of Contents\n\n" + "\n".join(toc_lines) + "\n\n" + "".join(content_lines))
+        # Keep the original file's permissions rather than the temp file's
+        shutil.copymode(target_file, tmp.name)
+        os.replace(tmp.name, target_file)
+    finally:
+        # Only still present if something failed before the swap
+        if os.path.exists(tmp.name):
+            os.unlink(tmp.name)
 
     print(f"Table of contents added to '{md_file}'.")
 
@@ -1,39 +1,67 @@
 import xml.etree.ElementTree as ET
 import re
 from collections import defaultdict
+from itertools import count
+
+# Matches namespace prefixes in XPath selectors (e.g. `fct` in `fct:ExternalLink`)
+PREFIX_PATTERN = re.compile(r'(\w+):\w+')
+# Matches the Ids of namespace list settings (e.g. `Xml_NS_List_0_NS_Prefix`)
+NS_SETTING_ID_PATTERN = re.compile(r'Xml_NS_List_(\d+)_NS_(Prefix|Uri)$')
 
 def find_missing_namespaces():
     # Prompt the user for the XML file path
     xml_file = input("Please enter the path to the XML settings file: ")
 
     try:
-        # Load and parse the XML file
-        tree = ET.parse(xml_file)
-        root = tree.getroot()
-        
-        # Find all declared namespaces by manually filtering elements
-        declared_namespaces = {}
-        settings = root.findall(".//Setting")
-        for elem in settings:
-            if elem.get("Id") == "Xml_NS_List_0_NS_Prefix":
-                ns_prefix = elem.text.strip() if elem.text else ""
-                # Look for the sibling `Xml_NS_List_0_NS_Uri` by iterating within the same parent
-                for sibling in elem.iterfind("../Setting"):
-                    if sibling.get("Id") == "Xml_NS_List_0_NS_Uri":
-                        declared_namespaces[ns_prefix] = sibling.text.strip() if sibling.text else ""
-
-        # Check XPath selectors for missing namespace prefixes
-        missing_namespaces = defaultdict(list)
-        for elem in settings:
-            if "XPathSelector" in elem.get("Id", ""):
-                xpath_selector = elem.text or ""
-                parser_rule = elem.get("Id")
-                
-                # Extract all prefixes in the XPath selector (e.g., `fct` in `fct:ExternalLink`)
-                prefixes = set(re.findall(r'(\w+):\w+', xpath_selector))
-                for prefix in prefixes:
-                    if prefix not in declared_namespaces:
-                        missing_namespaces[prefix].append(parser_rule)
+        # Stream the XML file in a single pass, sorting each Setting into
+        # namespace entries or XPath selector prefixes as it is read.
+        # Finished elements are detached from their parent, so only the
+        # elements on the path currently being parsed are held in memory.
+        ns_entries = defaultdict(dict)
+        used_prefixes = defaultdict(list)
+        # Each open element is stacked with a unique key, so settings can be
+        # grouped by the parent (e.g. `SettingsGroup`) they appear in
+        open_elements = []
+        element_keys = count()
+        for event, elem in ET.iterparse(xml_file, events=("start", "end")):
+            if event == "start":
+                open_elements.append((elem, next(element_keys)))
+                continue
+            open_elements.pop()
+            parent_key = None
+            if open_elements:
+                parent, parent_key = open_elements[-1]
+                parent.remove(elem)
+            if elem.tag != "Setting":
+                continue
+            setting_id = elem.get("Id", "")
+            text = elem.text or ""
+
+            ns_match = NS_SETTING_ID_PATTERN.match(setting_id)
+            if ns_match:
+                # Pair each `Xml_NS_List_<n>_NS_Prefix` with the `Xml_NS_List_<n>_NS_Uri`
+                # declared within the same parent
+                ns_entries[parent_key, ns_match.group(1)][ns_match.group(2)] = text.strip()
+            elif "XPathSelector" in setting_id:
+                # Extract all prefixes in the XPath selector (e.g., `fct` in `fct:ExternalLink`),
+                # de-duplicated in order of appearance so the report order is stable
+                for prefix in dict.fromkeys(PREFIX_PATTERN.findall(text)):
+                    used_prefixes[prefix].append(setting_id)
+
+        # Declared namespaces are the list entries with both a prefix and a
+        # non-empty URI; an empty URI still needs setting up
+        declared_namespaces = {
+            entry["Prefix"]: entry["Uri"]
+            for entry in ns_entries.values()
+            if "Prefix" in entry and entry.get("Uri")
+        }
+
+        # Check XPath selector prefixes for missing namespace declarations
+        missing_namespaces = {
+            prefix: parser_rules
+            for prefix, parser_rules in used_prefixes.items()
+            if prefix not in declared_namespaces
+        }
         
         # Print results
         if missing_namespaces: